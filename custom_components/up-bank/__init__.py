@@ -2,107 +2,677 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
+import hmac
 import logging
+import random
+import sys
+import time
+from collections import deque
 from datetime import timedelta
-from typing import Any, Dict, Optional
+from decimal import Decimal, InvalidOperation
+from typing import Any, Awaitable, Dict, Optional, Set
 
+import aiohttp
+from aiohttp import web
+from homeassistant.components import webhook
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.const import CONF_API_KEY
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.const import CONF_API_KEY, CONF_WEBHOOK_ID, EVENT_HOMEASSISTANT_CLOSE
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.network import NoURLAvailableError, get_url
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util import dt as dt_util, slugify
+from homeassistant.util.json import json_loads
+from yarl import URL
 
-DOMAIN = "up-bank"                 # must match folder name
-PLATFORMS: list[str] = ["sensor"]
-
-DEFAULT_REFRESH_MIN = 10           # safe default
-MAX_TX_PER_PAGE = 50               # page size for /transactions
-API_BASE = "https://api.up.com.au/api/v1"
+from .const import (
+    API_BASE,
+    CACHE_TTLS,
+    CIRCUIT_OPEN_SECONDS,
+    CIRCUIT_THRESHOLD,
+    CONDITIONAL_PATHS,
+    CONF_UP_WEBHOOK_ID,
+    CONF_WEBHOOK_SECRET,
+    CONF_WEBHOOK_URL,
+    DEFAULT_REFRESH_MIN,
+    DEFAULT_STATIC_REFRESH_MIN,
+    DOMAIN,
+    ETAG_CACHE_MAX,
+    FULL_TX_RESYNC,
+    MAX_BACKOFF,
+    MAX_PAGE_SIZE,
+    MAX_TX_PER_PAGE,
+    PLATFORMS,
+    REQUEST_TIMEOUT,
+    RETRY_ATTEMPTS,
+    STALE_DATA_MAX,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    WEBHOOK_POLL_MIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
-# ---------- Tiny API client using HA's shared aiohttp session ----------
+class UpRateLimited(UpdateFailed):
+    """Up answered 429/503; retry_after is the server's hint in seconds, if any."""
+
+    def __init__(self, status: int, retry_after: Optional[float]) -> None:
+        super().__init__(f"Up API throttled ({status}), retry after {retry_after or 'unspecified'}s")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class UpServerError(UpdateFailed):
+    """Up is transiently unavailable (5xx, or the circuit breaker is open); worth retrying."""
+
+
+# Failures worth retrying or riding out with cached data.
+_TRANSIENT_ERRORS = (UpServerError, aiohttp.ClientError, asyncio.TimeoutError)
+# Also ridden out with cached data, but never retried inline.
+_OUTAGE_ERRORS = (*_TRANSIENT_ERRORS, UpRateLimited)
+
+
+# ---------- Tiny API client with a dedicated keep-alive pool ----------
 class UpApi:
     def __init__(self, hass: HomeAssistant, token: str) -> None:
-        self._session = async_get_clientsession(hass)
+        # No Accept-Encoding here: aiohttp already negotiates gzip/deflate (plus br
+        # when brotli is installed) and decompresses transparently.
         self._headers = {"Authorization": f"Bearer {token}"}
+        self._session: Optional[aiohttp.ClientSession] = None
+        # (path, params) -> (validator headers, parsed body) from the last 200, so
+        # each page and the full /transactions page keep their own validators.
+        # Oldest-first; bounded by ETAG_CACHE_MAX as pagination cursors drift.
+        self._etag_cache: Dict[tuple, tuple[Dict[str, str], Dict[str, Any]]] = {}
+        # (path, params) -> (fresh until, sent at, parsed body) for paths in CACHE_TTLS
+        self._ttl_cache: Dict[tuple, tuple[float, float, Dict[str, Any]]] = {}
+        # How long a cached response may stand in for an unreachable Up; the
+        # coordinator keeps this in step with its poll interval.
+        self.stale_window = STALE_DATA_MAX
+        # (path, params) -> (request already on the wire, monotonic start), shared by concurrent callers
+        self._inflight: Dict[tuple, tuple[asyncio.Task, float]] = {}
+        # Circuit breaker: stop calling Up for a while after repeated failures.
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+        self._closed = False
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily and reused across every poll so connections to
+        # api.up.com.au stay alive between cycles instead of queueing behind
+        # other integrations on HA's shared pool.
+        if self._closed:
+            # A late caller (e.g. a webhook event racing unload) mustn't leak a new session.
+            raise UpdateFailed("Up API client is closed")
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=8,
+                    limit_per_host=4,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,  # aiohttp's 10s default re-resolves nearly every poll
+                    enable_cleanup_closed=True,
+                ),
+                headers=self._headers,
+                timeout=REQUEST_TIMEOUT,
+            )
+        return self._session
 
-    async def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    async def close(self) -> None:
+        self._closed = True
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _get(self, path: str, params: Optional[Dict[str, Any]] = None, fresh: bool = False) -> Dict[str, Any]:
+        fresh_ttl = CACHE_TTLS.get(path)
+        key = (path, tuple(sorted((params or {}).items())))
+        hit = self._ttl_cache.get(key) if fresh_ttl else None
+        if hit and not fresh and time.monotonic() < hit[0]:
+            return hit[2]
+
+        # Single-flight: concurrent callers for the same resource share one
+        # request. A fresh caller never joins one already on the wire, since it
+        # may predate the change the caller is reacting to; later callers join
+        # its newer request instead.
+        flight = None if fresh else self._inflight.get(key)
+        if flight is None:
+            flight = self._inflight[key] = (asyncio.ensure_future(self._fetch(path, params, key)), time.monotonic())
+
+            def _done(done: asyncio.Task) -> None:
+                # A fresh caller may have replaced this entry with its own request.
+                if self._inflight.get(key, (None,))[0] is done:
+                    del self._inflight[key]
+
+            flight[0].add_done_callback(_done)
+        task, started = flight
+        try:
+            # shield: one caller being cancelled mustn't cancel the others' request
+            body = await asyncio.shield(task)
+        except _OUTAGE_ERRORS as exc:
+            # Stale beats unavailable: keep sensors populated through short outages,
+            # including a 503. A 429 is ours to fix, so it still surfaces for backoff.
+            # The next scheduled poll is the revalidation.
+            if (
+                hit is None
+                or (isinstance(exc, UpRateLimited) and exc.status != 503)
+                or time.monotonic() >= hit[1] + self.stale_window.total_seconds()
+            ):
+                raise
+            _LOGGER.warning("Up API unreachable (%s); serving last good %s response", exc, path)
+            return hit[2]
+        # Age from when the request was sent, and never let an older request
+        # that finished late overwrite a newer (e.g. fresh) response.
+        current = self._ttl_cache.get(key)
+        if fresh_ttl and (current is None or current[0] <= started + fresh_ttl):
+            self._ttl_cache[key] = (started + fresh_ttl, started, body)
+        return body
+
+    async def _fetch(self, path: str, params: Optional[Dict[str, Any]], key: tuple) -> Dict[str, Any]:
+        if time.monotonic() < self._open_until:
+            raise UpServerError("Up API unavailable after repeated failures; pausing requests")
+        attempt = 0
+        while True:
+            try:
+                body = await self._fetch_once(path, params, key)
+            except _TRANSIENT_ERRORS:
+                if attempt >= RETRY_ATTEMPTS:
+                    self._record_failure()
+                    raise
+                # Exponential backoff with jitter so retries don't synchronise.
+                await asyncio.sleep(0.25 * 2 ** attempt + random.random() * 0.1)
+                attempt += 1
+            except UpRateLimited:
+                # The coordinator stretches its interval; retrying now would only add load.
+                self._record_failure()
+                raise
+            else:
+                self._consecutive_failures = 0
+                return body
+
+    def _record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= CIRCUIT_THRESHOLD:
+            self._open_until = time.monotonic() + CIRCUIT_OPEN_SECONDS
+            _LOGGER.warning("Up API failing repeatedly; pausing requests for %ss", CIRCUIT_OPEN_SECONDS)
+
+    async def _fetch_once(self, path: str, params: Optional[Dict[str, Any]], key: tuple) -> Dict[str, Any]:
         url = f"{API_BASE}{path}"
-        async with self._session.get(url, headers=self._headers, params=params, timeout=30) as resp:
-            text = await resp.text()
+        # filter[since] delta queries change every poll and would never revalidate.
+        conditional = path in CONDITIONAL_PATHS and "filter[since]" not in (params or {})
+        cached = self._etag_cache.get(key) if conditional else None
+        async with self._get_session().get(url, params=params, headers=cached[0] if cached else None) as resp:
+            if resp.status == 304 and cached:
+                # Unchanged since last fetch: skip both the body and the decode.
+                self._etag_cache[key] = self._etag_cache.pop(key, cached)  # mark recently used
+                return cached[1]
+            if resp.status in (429, 503):
+                try:
+                    retry_after: Optional[float] = float(resp.headers.get("Retry-After", ""))
+                except ValueError:
+                    retry_after = None  # missing, or an HTTP-date we don't bother parsing
+                raise UpRateLimited(resp.status, retry_after)
             if resp.status == 401:
                 raise UpdateFailed("Unauthorized (401). Check your Up API token.")
             if resp.status >= 400:
-                raise UpdateFailed(f"Up API error {resp.status}: {text[:200]}")
+                # Only error paths pay for a text decode of the body.
+                text = await resp.text()
+                error = UpServerError if resp.status >= 500 else UpdateFailed
+                raise error(f"Up API error {resp.status}: {text[:200]}")
             # Attempt JSON decode only after status checks
-            return await resp.json()
+            body = json_loads(await resp.read())
+            if conditional:
+                validators = {}
+                if etag := resp.headers.get("ETag"):
+                    validators["If-None-Match"] = etag
+                if last_modified := resp.headers.get("Last-Modified"):
+                    validators["If-Modified-Since"] = last_modified
+                if validators:
+                    self._etag_cache.pop(key, None)  # re-insert as newest
+                    self._etag_cache[key] = (validators, body)
+                    while len(self._etag_cache) > ETAG_CACHE_MAX:
+                        del self._etag_cache[next(iter(self._etag_cache))]
+            return body
+
+    async def _send(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Non-GET request; never cached. Returns None for empty (204) responses."""
+        async with self._get_session().request(method, f"{API_BASE}{path}", json=payload) as resp:
+            if resp.status >= 400:
+                text = await resp.text()
+                raise UpdateFailed(f"Up API error {resp.status}: {text[:200]}")
+            if resp.status == 204:
+                return None
+            return json_loads(await resp.read())
+
+    async def _get_all(self, path: str, params: Dict[str, Any], fresh: bool = False) -> Dict[str, Any]:
+        """Follow links.next and return every page's items as one {"data": [...]} body."""
+        # Up paginates with opaque page[after] cursors, so pages can only be
+        # walked in order; a large page size keeps this to one request normally.
+        body = await self._get(path, params, fresh)
+        data = list(body.get("data") or [])
+        next_link = (body.get("links") or {}).get("next")
+        while next_link:
+            next_url = URL(next_link)
+            page = await self._get(next_url.path.removeprefix(URL(API_BASE).path), dict(next_url.query), fresh)
+            data.extend(page.get("data") or [])
+            next_link = (page.get("links") or {}).get("next")
+        return {"data": data}
+
+    async def get_accounts(self, fresh: bool = False) -> Dict[str, Any]:
+        return await self._get_all("/accounts", {"page[size]": str(MAX_PAGE_SIZE)}, fresh)
+
+    async def get_transaction(self, transaction_id: str) -> Dict[str, Any]:
+        return await self._get(f"/transactions/{transaction_id}")
+
+    async def create_webhook(self, url: str) -> Dict[str, Any]:
+        payload = {"data": {"attributes": {"url": url, "description": "Home Assistant"}}}
+        return await self._send("POST", "/webhooks", payload) or {}
 
-    async def get_accounts(self) -> Dict[str, Any]:
-        return await self._get("/accounts")
+    async def delete_webhook(self, up_webhook_id: str) -> None:
+        await self._send("DELETE", f"/webhooks/{up_webhook_id}")
 
-    async def get_transactions(self, page_size: int = MAX_TX_PER_PAGE) -> Dict[str, Any]:
+    async def get_transactions(self, page_size: int = MAX_TX_PER_PAGE, since: Optional[str] = None) -> Dict[str, Any]:
         # Most recent first; one page is plenty for dashboards & notifications.
-        return await self._get("/transactions", params={"page[size]": str(page_size)})
+        params = {"page[size]": str(page_size)}
+        if since:
+            params["filter[since]"] = since
+        return await self._get("/transactions", params=params)
 
     async def get_categories(self) -> Dict[str, Any]:
         return await self._get("/categories")
 
     async def get_tags(self) -> Dict[str, Any]:
-        return await self._get("/tags")
+        return await self._get_all("/tags", {"page[size]": str(MAX_PAGE_SIZE)})
 
 
 # ---------- DataUpdateCoordinator ----------
+def _balance_value(account: Dict[str, Any]) -> Optional[Decimal]:
+    """The account's balance parsed exactly, or None when absent or malformed."""
+    value = ((account.get("attributes") or {}).get("balance") or {}).get("value")
+    if not isinstance(value, str):
+        return None
+    try:
+        balance = Decimal(value)
+    except InvalidOperation:
+        return None
+    # NaN/Infinity parse fine but would poison the total.
+    return balance if balance.is_finite() else None
+
+
+def _summarize_latest(tx: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Flatten the fields the latest-transaction sensors expose."""
+    if not tx:
+        return {"description": None, "amount": None, "time": None, "category_id": None, "tag_ids_csv": None}
+    attrs = tx.get("attributes") or {}
+    rels = tx.get("relationships") or {}
+    try:
+        amount: Optional[float] = float(attrs["amount"]["value"])
+    except Exception:
+        amount = None
+    category = ((rels.get("category") or {}).get("data") or {}).get("id")
+    tags = (rels.get("tags") or {}).get("data") or []
+    return {
+        "description": attrs.get("description"),
+        "amount": amount,
+        "time": attrs.get("createdAt"),
+        "category_id": category,
+        # Comma-separated tag IDs (Up's API returns ids for tags)
+        "tag_ids_csv": ", ".join(d["id"] for d in tags if isinstance(d, dict) and "id" in d),
+    }
+
+
 class UpDataCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
-    """Fetch accounts, recent transactions, categories, tags on a schedule."""
+    """Fetch accounts and recent transactions every cycle.
+
+    Categories and tags are persisted and only refetched when they age out or
+    a transaction references an id we don't know yet.
+    """
 
-    def __init__(self, hass: HomeAssistant, api: UpApi, update_interval: timedelta) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: UpApi,
+        update_interval: timedelta,
+        static_interval: timedelta = timedelta(minutes=DEFAULT_STATIC_REFRESH_MIN),
+        store: Optional[Store] = None,
+    ) -> None:
         super().__init__(hass, _LOGGER, name="Up Bank Coordinator", update_interval=update_interval)
         self.api = api
+        self.static_interval = static_interval
+        # Configured cadence; update_interval stretches above it while throttled.
+        self._base_interval = update_interval
+        self._consecutive_429 = 0
+        self._store = store
+        self._static: Dict[str, list] = {"categories": [], "tags": []}
+        # epoch of the last successful fetch (persisted); None means never
+        self._last_fetch: Dict[str, Optional[float]] = {"categories": None, "tags": None}
+        # unknown ids a refetch already failed to resolve, so we don't refetch for them every cycle
+        self._unresolved: Dict[str, Set[str]] = {"categories": set(), "tags": set()}
+        # Newest-first window of recent transactions, grown by delta fetches.
+        self._transactions: deque[Dict[str, Any]] = deque(maxlen=MAX_TX_PER_PAGE)
+        self._last_full_tx_fetch: Optional[float] = None  # monotonic
+        # display name -> slug; slugify is regex/unidecode heavy and names rarely change
+        self._slug_cache: Dict[str, str] = {}
+        # Serialises poll and webhook fetch-and-merge so a slower poll can't
+        # overwrite a transaction an event just applied.
+        self._lock = asyncio.Lock()
 
-    async def _async_update_data(self) -> Dict[str, Any]:
-        try:
-            # Fetch concurrently while staying very cheap (4 requests per cycle).
-            accounts_resp, tx_resp, cats_resp, tags_resp = await asyncio.gather(
-                self.api.get_accounts(),
-                self.api.get_transactions(page_size=MAX_TX_PER_PAGE),
-                self.api.get_categories(),
-                self.api.get_tags(),
+    def _slug(self, display_name: str) -> str:
+        slug = self._slug_cache.get(display_name)
+        if slug is None:
+            slug = self._slug_cache[display_name] = slugify(display_name)
+        return slug
+
+    def _static_due(self, name: str, now: float) -> bool:
+        last = self._last_fetch.get(name)
+        return last is None or now - last >= self.static_interval.total_seconds()
+
+    async def async_load_static(self) -> None:
+        """Seed categories/tags from storage so a restart doesn't refetch them."""
+        if self._store is None:
+            return
+        stored = await self._store.async_load() or {}
+        fetched_at = stored.get("fetched_at") or {}
+        for name in self._static:
+            if isinstance(stored.get(name), list):
+                self._static[name] = stored[name]
+                self._last_fetch[name] = fetched_at.get(name)
+
+    async def _async_save_static(self) -> None:
+        if self._store is not None:
+            await self._store.async_save({**self._static, "fetched_at": dict(self._last_fetch)})
+
+    def _unknown_refs(self, transactions: list) -> Dict[str, Set[str]]:
+        """Category/tag ids referenced by transactions but missing from the cached sets."""
+        known = {name: {item.get("id") for item in items} for name, items in self._static.items()}
+        unknown: Dict[str, Set[str]] = {"categories": set(), "tags": set()}
+        for tx in transactions:
+            rels = tx.get("relationships") or {}
+            cat = ((rels.get("category") or {}).get("data") or {}).get("id")
+            if cat and cat not in known["categories"]:
+                unknown["categories"].add(cat)
+            for tag in (rels.get("tags") or {}).get("data") or []:
+                if isinstance(tag, dict) and tag.get("id") and tag["id"] not in known["tags"]:
+                    unknown["tags"].add(tag["id"])
+        return unknown
+
+    def _tx_since(self) -> Optional[str]:
+        """createdAt of the newest known transaction, or None when a full page is due."""
+        last_full = self._last_full_tx_fetch
+        if not self._transactions or last_full is None or time.monotonic() - last_full >= FULL_TX_RESYNC.total_seconds():
+            return None
+        return (self._transactions[0].get("attributes") or {}).get("createdAt")
+
+    def _merge_transactions(self, new: list, full: bool) -> None:
+        """Fold newest-first transactions into the window, replacing entries with the same id."""
+        if full:
+            self._transactions = deque(new, maxlen=MAX_TX_PER_PAGE)
+            self._last_full_tx_fetch = time.monotonic()
+            return
+        if not new:
+            return
+        # filter[since] can return the previous newest again; replace, don't duplicate.
+        fresh_ids = {tx.get("id") for tx in new}
+        if any(tx.get("id") in fresh_ids for tx in self._transactions):
+            self._transactions = deque(
+                (tx for tx in self._transactions if tx.get("id") not in fresh_ids), maxlen=MAX_TX_PER_PAGE
             )
-        except Exception as exc:
-            raise UpdateFailed(f"Error fetching Up data: {exc}") from exc
+        self._transactions.extendleft(reversed(new))
 
-        accounts = accounts_resp.get("data") or []
-        transactions = tx_resp.get("data") or []
-        categories = cats_resp.get("data") or []
-        tags = tags_resp.get("data") or []
+    async def _gather(self, fetches: Dict[str, Awaitable[Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+        """Run fetches concurrently and raise one UpdateFailed summarizing any failures.
 
-        # Compute total balance safely
-        total = 0.0
-        for a in accounts:
+        Raises UpServerError instead when every failure is transient or a
+        throttle (already backed off here), so the caller can keep its data.
+        """
+        # return_exceptions lets every request settle so all failures are
+        # reported together instead of surfacing only the first one.
+        results = dict(zip(fetches, await asyncio.gather(*fetches.values(), return_exceptions=True)))
+        failures = [f"{name}: {res}" for name, res in results.items() if isinstance(res, BaseException)]
+        throttled = [res for res in results.values() if isinstance(res, UpRateLimited)]
+        if throttled:
+            self._back_off(max(t.retry_after or 0 for t in throttled))
+        if failures:
+            errors = [res for res in results.values() if isinstance(res, BaseException)]
+            error = UpServerError if all(isinstance(e, _OUTAGE_ERRORS) for e in errors) else UpdateFailed
+            raise error(f"Error fetching Up data ({'; '.join(failures)})")
+        return results
+
+    def _back_off(self, retry_after: Optional[float]) -> None:
+        """Stretch the poll interval: honour Retry-After, else double per throttled cycle."""
+        self._consecutive_429 += 1
+        backoff = self._base_interval * (2 ** self._consecutive_429)
+        if retry_after:
+            backoff = max(backoff, timedelta(seconds=retry_after))
+        self.update_interval = min(max(self.update_interval, backoff), max(MAX_BACKOFF, self._base_interval))
+        _LOGGER.warning("Up API is throttling; next poll in %s", self.update_interval)
+
+    def set_base_interval(self, interval: timedelta) -> None:
+        """Change the configured cadence, e.g. to a slow safety net once webhooks push updates."""
+        self._base_interval = interval
+        self.update_interval = interval
+
+    def _recover(self) -> None:
+        """Halve a stretched interval back toward the configured one after a clean cycle."""
+        self._consecutive_429 = 0
+        if self.update_interval > self._base_interval:
+            self.update_interval = max(self._base_interval, self.update_interval / 2)
+
+    def _stale_window(self) -> timedelta:
+        """How long to serve the last good data while Up is unreachable.
+
+        At least two poll intervals, so slow (webhook, long or throttled)
+        polling still gets one failed poll's worth of grace.
+        """
+        return max(STALE_DATA_MAX, 2 * self.update_interval)
+
+    async def _async_update_data(self) -> Dict[str, Any]:
+        async with self._lock:
+            stale_window = self.api.stale_window = self._stale_window()
+            try:
+                return await self._async_poll()
+            except UpServerError as exc:
+                # Ride out short outages on the last good data; last_success
+                # shows its age, and past the stale window sensors go unavailable.
+                last = (self.data or {}).get("last_success")
+                if last is None or dt_util.utcnow() - last > stale_window:
+                    raise
+                _LOGGER.warning("Up API unreachable (%s); keeping data from %s", exc, last)
+                return self.data
+
+    async def _async_poll(self) -> Dict[str, Any]:
+        now = time.time()
+        static_fetchers = {"categories": self.api.get_categories, "tags": self.api.get_tags}
+
+        # Fetch concurrently; categories/tags only join the batch when aged out.
+        since = self._tx_since()
+        fetches = {
+            "accounts": self.api.get_accounts(),
+            "transactions": self.api.get_transactions(page_size=MAX_TX_PER_PAGE, since=since),
+        }
+        for name, fetch in static_fetchers.items():
+            if self._static_due(name, now):
+                fetches[name] = fetch()
+        results = await self._gather(fetches)
+
+        accounts = results["accounts"].get("data") or []
+        self._merge_transactions(results["transactions"].get("data") or [], full=since is None)
+        transactions = list(self._transactions)
+
+        self._recover()
+
+        # Write-reactive: a transaction pointing at an id we've never seen
+        # means the set changed under us, so refetch it now.
+        unknown = self._unknown_refs(transactions)
+        stale = {
+            name for name, ids in unknown.items()
+            if name not in results and ids - self._unresolved[name]
+        }
+        if stale:
+            # Best-effort: accounts and transactions are already good, so a
+            # failed refetch keeps the cached set and retries next cycle.
+            try:
+                results.update(await self._gather({name: static_fetchers[name]() for name in stale}))
+            except UpdateFailed as exc:
+                _LOGGER.warning("Couldn't refresh %s for new ids: %s", ", ".join(sorted(stale)), exc)
+
+        refreshed = [name for name in static_fetchers if name in results]
+        for name in refreshed:
+            self._static[name] = results[name].get("data") or []
+            self._last_fetch[name] = now
+        if refreshed:
+            unknown = self._unknown_refs(transactions)
+            for name in refreshed:
+                self._unresolved[name] = unknown[name]
+            await self._async_save_static()
+        return self._build_data(accounts)
+
+    async def async_handle_transaction_event(self, event_type: str, transaction_id: str) -> None:
+        """Apply a webhook transaction event without waiting for the next poll."""
+        async with self._lock:
+            if self.data is None:
+                return
+            # A transaction event means balances just moved; skip the TTL cache.
+            fetches = {"accounts": self.api.get_accounts(fresh=True)}
+            if event_type != "TRANSACTION_DELETED":
+                fetches["transaction"] = self.api.get_transaction(transaction_id)
             try:
-                total += float(a["attributes"]["balance"]["value"])
-            except Exception:
+                results = await self._gather(fetches)
+            except UpdateFailed as exc:
+                # The next scheduled poll will pick the change up instead.
+                _LOGGER.warning("Couldn't apply Up webhook event %s: %s", event_type, exc)
+                return
+
+            if event_type == "TRANSACTION_DELETED":
+                self._transactions = deque(
+                    (tx for tx in self._transactions if tx.get("id") != transaction_id), maxlen=MAX_TX_PER_PAGE
+                )
+            elif tx := results["transaction"].get("data"):
+                for i, existing in enumerate(self._transactions):
+                    if existing.get("id") == transaction_id:
+                        self._transactions[i] = tx
+                        break
+                else:
+                    if event_type == "TRANSACTION_CREATED":
+                        self._transactions.appendleft(tx)
+            self.async_set_updated_data(self._build_data(results["accounts"].get("data") or []))
+
+    def _build_data(self, accounts: list) -> Dict[str, Any]:
+        """Derive everything sensors read from the latest accounts and cached transactions."""
+        transactions = list(self._transactions)
+        categories = self._static["categories"]
+        tags = self._static["tags"]
+
+        # Index accounts once per refresh so sensors do O(1) lookups.
+        accounts_by_id: Dict[str, Dict[str, Any]] = {}
+        balances_by_id: Dict[str, float] = {}
+        account_slugs: Dict[str, str] = {}
+        # Sum the API's decimal strings exactly; floats would drift on cents.
+        total = Decimal("0")
+        for a in accounts:
+            acct_id = a.get("id")
+            if acct_id:
+                # Same few ids are used as keys every cycle; intern to share them.
+                acct_id = sys.intern(acct_id)
+                accounts_by_id[acct_id] = a
+                display_name = (a.get("attributes") or {}).get("displayName") or "Up Account"
+                account_slugs[acct_id] = self._slug(display_name) or acct_id
+            balance = _balance_value(a)
+            if balance is None:
                 continue
+            total += balance
+            if acct_id:
+                balances_by_id[acct_id] = float(balance)
 
         return {
             "accounts": accounts,
+            "accounts_by_id": accounts_by_id,
+            "balances_by_id": balances_by_id,
+            "account_slugs": account_slugs,
             "transactions": transactions,
+            "latest": _summarize_latest(transactions[0] if transactions else None),
             "categories": categories,
             "tags": tags,
+            "last_success": dt_util.utcnow(),
             "summary": {
-                "total_balance": total,
+                "total_balance": float(total),
                 "account_count": len(accounts),
                 "transaction_count": len(transactions),
             },
         }
 
 
+# ---------- Webhook push updates ----------
+async def _async_handle_webhook(
+    entry_id: str, secret: str, hass: HomeAssistant, webhook_id: str, request: web.Request
+) -> Optional[web.Response]:
+    # entry_id and secret are bound at registration, so no per-delivery lookup can miss.
+    wrapper = hass.data.get(DOMAIN, {}).get(entry_id)
+    if wrapper is None:
+        return None
+    body = await request.read()
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    if not hmac.compare_digest(expected, request.headers.get("X-Up-Authenticity-Signature", "")):
+        _LOGGER.warning("Rejected Up webhook call with an invalid signature")
+        return web.Response(status=401)
+
+    event = (json_loads(body) or {}).get("data") or {}
+    event_type = (event.get("attributes") or {}).get("eventType")
+    transaction = ((event.get("relationships") or {}).get("transaction") or {}).get("data") or {}
+    if event_type in ("TRANSACTION_CREATED", "TRANSACTION_SETTLED", "TRANSACTION_DELETED") and transaction.get("id"):
+        # Acknowledge immediately; Up retries deliveries that take too long.
+        # Tied to the entry so unload cancels it rather than letting it outlive the API.
+        wrapper["entry"].async_create_background_task(
+            hass,
+            wrapper["coordinator"].async_handle_transaction_event(event_type, transaction["id"]),
+            "up_bank_webhook_event",
+        )
+    return None
+
+
+async def _async_setup_webhook(hass: HomeAssistant, entry: ConfigEntry, api: UpApi) -> Optional[str]:
+    """Make sure Up pushes events to this entry's webhook; returns the signing secret, or None to poll only."""
+    data = dict(entry.data)
+    if not data.get(CONF_WEBHOOK_ID):
+        data[CONF_WEBHOOK_ID] = webhook.async_generate_id()
+    try:
+        url = get_url(hass, allow_internal=False, require_ssl=True) + webhook.async_generate_path(data[CONF_WEBHOOK_ID])
+    except NoURLAvailableError:
+        _LOGGER.info("No external HTTPS URL available; Up Bank will rely on polling only")
+        url = None
+
+    if url and (data.get(CONF_WEBHOOK_URL) != url or not data.get(CONF_WEBHOOK_SECRET)):
+        if data.get(CONF_UP_WEBHOOK_ID):
+            # Replace a registration pointing at an old URL; it may already be gone.
+            try:
+                await api.delete_webhook(data[CONF_UP_WEBHOOK_ID])
+            except (UpdateFailed, aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                _LOGGER.debug("Couldn't delete stale Up webhook: %s", exc)
+            data.pop(CONF_UP_WEBHOOK_ID)
+        try:
+            created = (await api.create_webhook(url)).get("data") or {}
+        except (UpdateFailed, aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            _LOGGER.warning("Couldn't register an Up webhook, polling only: %s", exc)
+        else:
+            data[CONF_UP_WEBHOOK_ID] = created.get("id")
+            data[CONF_WEBHOOK_SECRET] = (created.get("attributes") or {}).get("secretKey")
+            data[CONF_WEBHOOK_URL] = url
+
+    if data != entry.data:
+        hass.config_entries.async_update_entry(entry, data=data)
+    if not url or data.get(CONF_WEBHOOK_URL) != url or not data.get(CONF_WEBHOOK_SECRET):
+        return None
+    handler = functools.partial(_async_handle_webhook, entry.entry_id, data[CONF_WEBHOOK_SECRET])
+    webhook.async_register(hass, DOMAIN, "Up Bank", data[CONF_WEBHOOK_ID], handler, local_only=False)
+    entry.async_on_unload(lambda: webhook.async_unregister(hass, data[CONF_WEBHOOK_ID]))
+    return data[CONF_WEBHOOK_SECRET]
+
+
 # ---------- Setup / Options handling ----------
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload when options (e.g., refresh interval) change."""
@@ -118,25 +688,72 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not isinstance(refresh_min, int) or refresh_min <= 0:
         refresh_min = DEFAULT_REFRESH_MIN
 
+    static_min = entry.options.get("categories_refresh_minutes", DEFAULT_STATIC_REFRESH_MIN)
+    if not isinstance(static_min, int) or static_min <= 0:
+        static_min = DEFAULT_STATIC_REFRESH_MIN
+
     api = UpApi(hass, token)
-    coordinator = UpDataCoordinator(hass, api, timedelta(minutes=refresh_min))
+    store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry.entry_id}")
+    coordinator = UpDataCoordinator(
+        hass, api, timedelta(minutes=refresh_min), timedelta(minutes=static_min), store
+    )
+    await coordinator.async_load_static()
+
+    # HA doesn't unload entries on shutdown, so close the dedicated session then too.
+    async def _async_close_api(_event: Event) -> None:
+        await api.close()
+
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_api))
+
+    try:
+        await _async_setup_api(hass, entry, api, coordinator, refresh_min)
+    except Exception:
+        # Unload isn't called for a failed setup; don't leak the session.
+        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+        await api.close()
+        raise
+    _LOGGER.debug("Up Bank setup complete (interval=%s min)", refresh_min)
+    return True
 
+
+async def _async_setup_api(
+    hass: HomeAssistant, entry: ConfigEntry, api: UpApi, coordinator: UpDataCoordinator, refresh_min: int
+) -> None:
     # First refresh must succeed before platforms are forwarded.
     await coordinator.async_config_entry_first_refresh()
     if not coordinator.last_update_success:
         raise ConfigEntryNotReady("Initial Up API fetch failed.")
 
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {"coordinator": coordinator, "api": api}
+    hass.data[DOMAIN][entry.entry_id] = {"coordinator": coordinator, "api": api, "entry": entry}
+
+    # Entry data updates must happen before the reload listener is attached.
+    if await _async_setup_webhook(hass, entry, api):
+        # Pushes keep data fresh; polling stays on as a slow safety net.
+        coordinator.set_base_interval(max(timedelta(minutes=refresh_min), timedelta(minutes=WEBHOOK_POLL_MIN)))
 
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    _LOGGER.debug("Up Bank setup complete (interval=%s min)", refresh_min)
-    return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+        wrapper = hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+        if wrapper:
+            await wrapper["api"].close()
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the persisted categories/tags cache and Up-side webhook for a deleted entry."""
+    await Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry.entry_id}").async_remove()
+    token = entry.data.get(CONF_API_KEY) or entry.data.get("token")
+    if token and entry.data.get(CONF_UP_WEBHOOK_ID):
+        api = UpApi(hass, token)
+        try:
+            await api.delete_webhook(entry.data[CONF_UP_WEBHOOK_ID])
+        except (UpdateFailed, aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            _LOGGER.warning("Couldn't delete the Up webhook: %s", exc)
+        finally:
+            await api.close()
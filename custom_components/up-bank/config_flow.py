@@ -2,8 +2,10 @@ import logging
 from typing import Any
 from homeassistant import config_entries
 from homeassistant.const import CONF_API_KEY
+from homeassistant.core import callback
 import voluptuous as vol
 from .const import DOMAIN
+from .options_flow import UpBankOptionsFlowHandler
 from .up import UP
 
 DATA_SCHEMA = vol.Schema({
@@ -14,12 +16,18 @@ _LOGGER = logging.getLogger(__name__)
 class UpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_CLOUD_POLL
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        return UpBankOptionsFlowHandler()
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None):
         errors = {}
         if user_input is not None:
             api_key = user_input[CONF_API_KEY]
             try:
-                up = UP(api_key)
+                up = UP(self.hass, api_key)
                 info = await up.test(api_key)
 
                 if info:
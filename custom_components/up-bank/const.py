@@ -1,3 +1,38 @@
-DOMAIN = "up-bank"
-PLATFORMS = ["sensor"]  
-CONF_API_KEY = "api_key"  # Ensure CONF_API_KEY is defined later
+"""Shared constants for the Up Bank integration."""
+from datetime import timedelta
+
+import aiohttp
+
+DOMAIN = "up-bank"                 # must match folder name
+PLATFORMS: list[str] = ["sensor"]
+
+DEFAULT_REFRESH_MIN = 10           # safe default
+DEFAULT_STATIC_REFRESH_MIN = 7 * 24 * 60  # categories/tags rarely change; new ids trigger a refetch
+MAX_TX_PER_PAGE = 50               # page size for /transactions
+MAX_PAGE_SIZE = 100                # largest page Up serves, for full listings
+API_BASE = "https://api.up.com.au/api/v1"
+WEBHOOK_POLL_MIN = 60              # safety-net poll once Up pushes events
+CONF_UP_WEBHOOK_ID = "up_webhook_id"   # id of the webhook on Up's side
+CONF_WEBHOOK_SECRET = "webhook_secret"  # Up's HMAC signing key for deliveries
+CONF_WEBHOOK_URL = "webhook_url"       # URL registered with Up
+STORAGE_KEY = "up_bank_static"     # persisted categories/tags, suffixed per entry
+STORAGE_VERSION = 1
+# Fresh seconds per path: reuse a response as-is to absorb bursts of manual
+# refreshes. Past that it's only a fallback while Up is unreachable, for as
+# long as the coordinator's stale window (see STALE_DATA_MAX).
+CACHE_TTLS = {"/accounts": 30}
+# Polled endpoints revalidated with conditional GETs (If-None-Match / If-Modified-Since).
+CONDITIONAL_PATHS = frozenset({"/accounts", "/transactions", "/categories", "/tags"})
+ETAG_CACHE_MAX = 32                # validator slots kept; pages and full listings fit easily
+# Fail fast on a hung connection instead of stalling the poll; retries cover blips.
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3, sock_read=8)
+MAX_BACKOFF = timedelta(hours=1)   # ceiling while throttled
+# Delta fetches can't see edits to older transactions (settlement, recategorising),
+# so the full recent page is re-read at least this often.
+FULL_TX_RESYNC = timedelta(hours=1)
+RETRY_ATTEMPTS = 3                 # extra tries for 5xx / connection errors
+CIRCUIT_THRESHOLD = 5              # consecutive failed requests before the breaker opens
+CIRCUIT_OPEN_SECONDS = 60
+# Minimum time sensors keep showing the last good data while Up is unreachable;
+# stretched to two poll intervals when polling is slower than that.
+STALE_DATA_MAX = timedelta(hours=1)
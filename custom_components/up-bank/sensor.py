@@ -1,16 +1,18 @@
 """Sensors for Up Bank: per-account balances, totals, and latest txn info."""
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import List, Optional
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import slugify
 
-from . import DOMAIN, UpDataCoordinator
+from . import UpDataCoordinator
+from .const import DOMAIN
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
@@ -30,6 +32,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     entities.append(UpTotalBalanceSensor(coordinator, entry))
     entities.append(UpAccountCountSensor(coordinator, entry))
     entities.append(UpTransactionCountSensor(coordinator, entry))
+    entities.append(UpLastSuccessSensor(coordinator, entry))
 
     # Latest txn sensors (description, amount, time, category, tags)
     entities.append(UpLatestTxnDescriptionSensor(coordinator, entry))
@@ -61,7 +64,7 @@ class UpAccountBalanceSensor(_BaseUpSensor):
 
     def __init__(self, coordinator: UpDataCoordinator, entry: ConfigEntry, account_id: str, display_name: str) -> None:
         super().__init__(coordinator, entry)
-        slug = slugify(display_name) or account_id
+        slug = coordinator.data.get("account_slugs", {}).get(account_id) or account_id
         self._account_id = account_id
         self._attr_unique_id = f"{entry.entry_id}_acct_{account_id}_balance"
         self._attr_name = f"{display_name} Balance"
@@ -72,13 +75,7 @@ class UpAccountBalanceSensor(_BaseUpSensor):
 
     @property
     def native_value(self) -> Optional[float]:
-        for acct in self.coordinator.data.get("accounts", []):
-            if acct.get("id") == self._account_id:
-                try:
-                    return float(acct["attributes"]["balance"]["value"])
-                except Exception:
-                    return None
-        return None
+        return self.coordinator.data.get("balances_by_id", {}).get(self._account_id)
 
 
 # ---------- Summary ----------
@@ -93,12 +90,7 @@ class UpTotalBalanceSensor(_BaseUpSensor):
 
     @property
     def native_value(self) -> Optional[float]:
-        summary = self.coordinator.data.get("summary") or {}
-        val = summary.get("total_balance")
-        try:
-            return float(val) if val is not None else None
-        except Exception:
-            return None
+        return (self.coordinator.data.get("summary") or {}).get("total_balance")
 
 
 class UpAccountCountSensor(_BaseUpSensor):
@@ -125,6 +117,24 @@ class UpTransactionCountSensor(_BaseUpSensor):
         return len(self.coordinator.data.get("transactions", []))
 
 
+class UpLastSuccessSensor(_BaseUpSensor):
+    """When Up data was last fetched; shows its age while an outage is ridden out."""
+
+    def __init__(self, coordinator: UpDataCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.entry_id}_last_success"
+        self._attr_name = "Up Last Success"
+        self._attr_icon = "mdi:cloud-check-outline"
+        self._attr_device_class = SensorDeviceClass.TIMESTAMP
+        # One diagnostic entity carries the timestamp, so the balance sensors
+        # only record a new state when their values actually change.
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    @property
+    def native_value(self) -> Optional[datetime]:
+        return self.coordinator.data.get("last_success")
+
+
 # ---------- Latest transaction ----------
 class _LatestTxnBase(_BaseUpSensor):
     def __init__(self, coordinator: UpDataCoordinator, entry: ConfigEntry, suffix: str, unique_suffix: str, icon: str) -> None:
@@ -133,11 +143,6 @@ class _LatestTxnBase(_BaseUpSensor):
         self._attr_name = f"Up Latest Transaction {suffix}"
         self._attr_icon = icon
 
-    @property
-    def _latest(self) -> Optional[Dict[str, Any]]:
-        tx = self.coordinator.data.get("transactions", [])
-        return tx[0] if tx else None
-
 
 class UpLatestTxnDescriptionSensor(_LatestTxnBase):
     def __init__(self, coordinator: UpDataCoordinator, entry: ConfigEntry) -> None:
@@ -145,10 +150,7 @@ class UpLatestTxnDescriptionSensor(_LatestTxnBase):
 
     @property
     def native_value(self) -> Optional[str]:
-        lt = self._latest
-        if not lt:
-            return None
-        return (lt.get("attributes") or {}).get("description")
+        return self.coordinator.data["latest"]["description"]
 
 
 class UpLatestTxnAmountSensor(_LatestTxnBase):
@@ -158,13 +160,7 @@ class UpLatestTxnAmountSensor(_LatestTxnBase):
 
     @property
     def native_value(self) -> Optional[float]:
-        lt = self._latest
-        if not lt:
-            return None
-        try:
-            return float(lt["attributes"]["amount"]["value"])
-        except Exception:
-            return None
+        return self.coordinator.data["latest"]["amount"]
 
 
 class UpLatestTxnTimeSensor(_LatestTxnBase):
@@ -173,10 +169,7 @@ class UpLatestTxnTimeSensor(_LatestTxnBase):
 
     @property
     def native_value(self) -> Optional[str]:
-        lt = self._latest
-        if not lt:
-            return None
-        return (lt.get("attributes") or {}).get("createdAt")
+        return self.coordinator.data["latest"]["time"]
 
 
 class UpLatestTxnCategorySensor(_LatestTxnBase):
@@ -185,12 +178,8 @@ class UpLatestTxnCategorySensor(_LatestTxnBase):
 
     @property
     def native_value(self) -> Optional[str]:
-        lt = self._latest
-        if not lt:
-            return None
-        rel = (lt.get("relationships") or {}).get("category") or {}
-        data = rel.get("data") or {}
-        return data.get("id")  # returns category id (can be mapped to name via categories)
+        # category id (can be mapped to name via categories)
+        return self.coordinator.data["latest"]["category_id"]
 
 
 class UpLatestTxnTagsSensor(_LatestTxnBase):
@@ -199,12 +188,4 @@ class UpLatestTxnTagsSensor(_LatestTxnBase):
 
     @property
     def native_value(self) -> Optional[str]:
-        lt = self._latest
-        if not lt:
-            return None
-        rel = (lt.get("relationships") or {}).get("tags") or {}
-        data = rel.get("data") or []
-        # Return comma-separated tag IDs (Up's API returns ids for tags)
-        if not data:
-            return ""
-        return ", ".join([d.get("id", "") for d in data if isinstance(d, dict)])
+        return self.coordinator.data["latest"]["tag_ids_csv"]
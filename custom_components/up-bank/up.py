@@ -1,56 +1,66 @@
+import asyncio
 import aiohttp
 import logging
 
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
+
+from .const import API_BASE, REQUEST_TIMEOUT
+
 _LOGGER = logging.getLogger(__name__)
 #_LOGGER.setLevel(logging.DEBUG)  # Ensure debug-level messages are logged
 
-BASE_URL = "https://api.up.com.au/api/v1"
-
 class UP:
-    def __init__(self, api_key):
+    def __init__(self, hass, api_key):
         self.api_key = api_key
+        # HA owns this pooled session; never close it here.
+        self._session = async_get_clientsession(hass)
+        self._headers = {"Authorization": f"Bearer {api_key}"}
 
-    async def call(self, endpoint, params=None, method="get"):
+    async def call(self, endpoint, params=None, method="get", api_key=None):
         if params is None:
             params = {}
-        headers = {"Authorization": f"Bearer {self.api_key}"}
+        # A per-call key only swaps this request's Authorization header, so
+        # concurrent validations never touch shared state.
+        headers = self._headers if api_key is None else {**self._headers, "Authorization": f"Bearer {api_key}"}
         
-        _LOGGER.debug(f"Making {method.upper()} request to {BASE_URL + endpoint} with headers: {headers} and params: {params}")
+        # Lazy %-formatting; never log the bearer token itself.
+        _LOGGER.debug("Making %s request to %s with params: %s", method.upper(), API_BASE + endpoint, params)
         
-        async with aiohttp.ClientSession(headers=headers) as session:
-            try:
-                async with session.request(method, BASE_URL + endpoint, params=params) as resp:
-                    _LOGGER.debug(f"Received response status: {resp.status}")
-                    
-                    if resp.status == 401:
-                        _LOGGER.error("Unauthorized: Invalid API Key")
-                        return None
-                    if resp.status != 200:
-                        _LOGGER.error(f"Error: Received status code {resp.status}")
-                        return None
-                    
-                    response_data = await resp.json()
-                    _LOGGER.debug(f"Response JSON: {response_data}")
-                    return response_data
-            except aiohttp.ClientError as e:
-                _LOGGER.error(f"Network error occurred: {e}")
-                return None
+        try:
+            async with self._session.request(
+                method,
+                API_BASE + endpoint,
+                headers=headers,
+                params=params,
+                timeout=REQUEST_TIMEOUT,
+            ) as resp:
+                _LOGGER.debug("Received response status: %s", resp.status)
+                
+                if resp.status == 401:
+                    _LOGGER.error("Unauthorized: Invalid API Key")
+                    return None
+                if resp.status != 200:
+                    _LOGGER.error("Error: Received status code %s", resp.status)
+                    return None
+                
+                response_data = json_loads(await resp.read())
+                _LOGGER.debug("Response JSON: %s", response_data)
+                return response_data
+        except aiohttp.ClientError as e:
+            _LOGGER.error("Network error occurred: %s", e)
+            return None
+        except asyncio.TimeoutError:
+            _LOGGER.error("Request to %s timed out", API_BASE + endpoint)
+            return None
 
     async def test(self, api_key=None) -> bool:
-        original_key = self.api_key
-        if api_key:
-            self.api_key = api_key
-        
-        try:
-            result = await self.call("/util/ping")
-            if result is not None:
-                _LOGGER.debug("API key validated successfully.")
-                return True
-            else:
-                _LOGGER.error("API key validation failed.")
-                return False
-        finally:
-            self.api_key = original_key
+        result = await self.call("/util/ping", api_key=api_key or None)
+        if result is not None:
+            _LOGGER.debug("API key validated successfully.")
+            return True
+        _LOGGER.error("API key validation failed.")
+        return False
 
     async def get_accounts(self):
         result = await self.call('/accounts', {"page[size]": 100})
@@ -58,18 +68,18 @@ class UP:
             _LOGGER.warning("Failed to retrieve accounts.")
             return None
 
-        accounts = {}
-        for account in result.get('data', []):
-            details = BankAccount(account)
-            accounts[details.id] = details
-        _LOGGER.debug(f"Retrieved accounts: {accounts}")
+        accounts = {ba.id: ba for ba in map(BankAccount, result.get('data') or ())}
+        _LOGGER.debug("Retrieved accounts: %s", accounts)
         return accounts
 
 class BankAccount:
+    __slots__ = ("name", "balance", "id", "created_at", "account_type", "ownership")
+
     def __init__(self, data):
-        self.name = data['attributes']['displayName']
-        self.balance = data['attributes']['balance']['value']
+        attributes = data['attributes']
+        self.name = attributes['displayName']
+        self.balance = attributes['balance']['value']
         self.id = data['id']
-        self.created_at = data['attributes']['createdAt']
-        self.account_type = data['attributes']['accountType']
-        self.ownership = data['attributes']['ownershipType']
+        self.created_at = attributes['createdAt']
+        self.account_type = attributes['accountType']
+        self.ownership = attributes['ownershipType']